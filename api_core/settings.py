@@ -72,8 +72,18 @@ if config('DATABASE_URL', default=None):
     # Production database (PostgreSQL on Render)
     import dj_database_url
     DATABASES = {
-        'default': dj_database_url.parse(config('DATABASE_URL'))
+        'default': dj_database_url.parse(
+            config('DATABASE_URL'),
+            # Keep connections open between requests so the one each gunicorn
+            # worker opens at boot (see gunicorn.conf.py) is reused
+            conn_max_age=config('CONN_MAX_AGE', default=600, cast=int),
+            conn_health_checks=True,
+        )
     }
+    # Fail fast instead of blocking a booting worker on an unreachable database
+    if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+        DATABASES['default'].setdefault('OPTIONS', {})['connect_timeout'] = config(
+            'DB_CONNECT_TIMEOUT', default=5, cast=int)
 else:
     # Development database (SQLite)
     DATABASES = {
@@ -84,6 +94,29 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+# Local memory is per process, so each gunicorn worker has its own copy.
+# Cached challenges include their base64 image, so keep the entry count small.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'api-core',
+        'OPTIONS': {
+            'MAX_ENTRIES': config('CACHE_MAX_ENTRIES', default=20, cast=int),
+        },
+    }
+}
+
+# Seconds a serialized challenge stays cached. Every read checks the cached
+# copy against the challenge's updated_at, so edits show up immediately.
+CHALLENGE_CACHE_TIMEOUT = config('CHALLENGE_CACHE_TIMEOUT', default=600, cast=int)
+
+# How many challenges, from today's onwards by date, each worker loads when it boots
+CHALLENGE_CACHE_WARM_COUNT = config('CHALLENGE_CACHE_WARM_COUNT', default=7, cast=int)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -0,0 +1,69 @@
+"""
+Worker start-up helpers for api_core.
+
+Used by the hooks in gunicorn.conf.py and by the ``startup_report``
+management command. Everything here expects Django to be set up already.
+"""
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def _elapsed_ms(start):
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+def load_url_resolver():
+    """
+    Import the URLconf (and with it every view, serializer and DRF module it
+    references) and build the resolver. Run in the gunicorn master so forked
+    workers inherit the result. Returns the time taken in milliseconds.
+    """
+    from django.urls import reverse
+
+    start = time.perf_counter()
+    try:
+        # Reversing any name populates the resolver for the whole URLconf
+        reverse('health')
+    except Exception:
+        logger.exception("Could not build URL resolver during warm-up")
+    return _elapsed_ms(start)
+
+
+def warm_worker():
+    """
+    Do the per-process work a fresh worker would otherwise pay for on its
+    first request: open database connections and fill the challenge cache.
+    Returns the time each step took in milliseconds, how many challenges
+    were cached and an ``errors`` list naming any step that failed.
+
+    Each step logs and skips its own failure so a database hiccup never stops
+    a worker from booting.
+    """
+    from django.db import connections
+
+    from hocus_focus.challenges.cache import warm_challenge_cache
+
+    timings = {'errors': []}
+
+    start = time.perf_counter()
+    try:
+        for connection in connections.all():
+            connection.ensure_connection()
+    except Exception as e:
+        logger.exception("Could not open database connection during warm-up")
+        timings['errors'].append(f"db_connect: {e}")
+    timings['db_connect_ms'] = _elapsed_ms(start)
+
+    start = time.perf_counter()
+    try:
+        timings['challenges_cached'] = warm_challenge_cache()
+    except Exception as e:
+        logger.exception("Could not warm challenge cache")
+        timings['challenges_cached'] = 0
+        timings['errors'].append(f"challenge_cache: {e}")
+    timings['challenge_cache_ms'] = _elapsed_ms(start)
+
+    return timings
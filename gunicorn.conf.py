@@ -0,0 +1,63 @@
+"""
+Gunicorn configuration for api_core.
+
+Gunicorn loads ./gunicorn.conf.py automatically, so the Render start command
+``gunicorn api_core.wsgi:application`` picks this up unchanged. Bind address
+and worker count still come from gunicorn's own PORT / WEB_CONCURRENCY
+environment variables.
+"""
+
+import time
+
+# Run django.setup() once in the master process instead of in every worker
+preload_app = True
+
+
+def when_ready(server):
+    # Runs in the master after the app is loaded and before any worker is
+    # forked. Loading the URLconf here imports the views, serializers and DRF,
+    # so workers inherit them instead of importing them on their first request.
+    from api_core.startup import load_url_resolver
+
+    server.log.info("URL resolver built in %.1f ms", load_url_resolver())
+
+
+def pre_fork(server, worker):
+    # Never hand a database socket opened in the master to a worker
+    from django.db import connections
+    connections.close_all()
+
+
+def post_fork(server, worker):
+    worker.forked_at = time.perf_counter()
+    worker.served_first_request = False
+
+
+def post_worker_init(worker):
+    # Warm up inside the worker process once it is initialised. Database
+    # connects are capped by DB_CONNECT_TIMEOUT (see settings) so a slow
+    # database cannot hold the worker past gunicorn's timeout.
+    from api_core.startup import warm_worker
+
+    timings = warm_worker()
+    worker.log.info(
+        "Worker %s warmed in %.1f ms %s",
+        worker.pid, (time.perf_counter() - worker.forked_at) * 1000, timings,
+    )
+
+
+def pre_request(worker, req):
+    worker.request_started_at = time.perf_counter()
+
+
+def post_request(worker, req, environ, resp):
+    if worker.served_first_request:
+        return
+    worker.served_first_request = True
+    # The request's own latency is the cold-start cost; the time since fork
+    # mostly reflects how long the worker waited for traffic
+    now = time.perf_counter()
+    worker.log.info(
+        "Worker %s served its first request in %.1f ms (%.1f ms after fork)",
+        worker.pid, (now - worker.request_started_at) * 1000, (now - worker.forked_at) * 1000,
+    )
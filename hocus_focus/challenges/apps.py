@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ChallengesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'hocus_focus.challenges'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+
+from .models import Challenge
+from .serializers import ChallengeSerializer
+
+
+def _cache_key(challenge_id):
+    return f"challenge:{challenge_id}"
+
+
+def _cache_entry(challenge):
+    return {
+        'updated_at': challenge.updated_at,
+        'data': dict(ChallengeSerializer(challenge).data),
+    }
+
+
+def get_challenge_data(challenge_id):
+    """
+    Return serialized data for a challenge, reading through the cache.
+    Raises Http404 if the challenge does not exist.
+
+    The default cache is local memory, so every gunicorn worker keeps its own
+    copy. Each read checks that copy against the challenge's updated_at with a
+    one-column query, so an edit saved by any worker is seen by all of them;
+    a hit only skips loading the image and serializing. Writes that bypass
+    save() (QuerySet.update) must set updated_at themselves.
+    """
+    updated_at = Challenge.objects.filter(id=challenge_id).values_list('updated_at', flat=True).first()
+    if updated_at is None:
+        raise Http404
+
+    key = _cache_key(challenge_id)
+    entry = cache.get(key)
+    if entry is None or entry['updated_at'] != updated_at:
+        entry = _cache_entry(get_object_or_404(Challenge, id=challenge_id))
+        cache.set(key, entry, settings.CHALLENGE_CACHE_TIMEOUT)
+    return entry['data']
+
+
+def warm_challenge_cache(limit=None):
+    """
+    Load today's challenge and the ones scheduled after it into the cache.
+    Returns the number of challenges cached.
+
+    Assumes `date` holds ISO dates (YYYY-MM-DD), which sort correctly as
+    strings. Challenges with any other date format are simply not warmed.
+    """
+    if limit is None:
+        limit = settings.CHALLENGE_CACHE_WARM_COUNT
+    today = timezone.localdate().isoformat()
+    challenges = Challenge.objects.filter(date__gte=today).order_by('date', 'id')[:limit]
+    entries = {_cache_key(challenge.id): _cache_entry(challenge) for challenge in challenges}
+    cache.set_many(entries, settings.CHALLENGE_CACHE_TIMEOUT)
+    return len(entries)
+
+
+def invalidate_challenge(challenge_id):
+    """Drop a challenge from this process's cache to free its memory early"""
+    cache.delete(_cache_key(challenge_id))
@@ -0,0 +1,131 @@
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+# This reports on the whole project (api_core.wsgi, api_core.startup). It lives
+# in the challenges app only because api_core is not an installed app and
+# management commands are discovered per app.
+
+# Runs in a fresh interpreter so nothing imported by manage.py skews the numbers
+PROBE = """
+import json, sys, time
+from wsgiref.util import setup_testing_defaults
+
+start = time.perf_counter()
+from api_core.wsgi import application
+imported = time.perf_counter()
+
+from api_core.startup import load_url_resolver, warm_worker
+load_url_resolver()
+resolved = time.perf_counter()
+warm_up = warm_worker()
+warmed = time.perf_counter()
+
+environ = {'PATH_INFO': sys.argv[1]}
+setup_testing_defaults(environ)
+environ['HTTP_HOST'] = environ['SERVER_NAME'] = sys.argv[2]
+status = []
+body = application(environ, lambda s, headers, exc_info=None: status.append(s))
+b''.join(body)
+body.close()
+served = time.perf_counter()
+
+print(json.dumps({
+    'setup_ms': round((imported - start) * 1000, 1),
+    'url_resolver_ms': round((resolved - imported) * 1000, 1),
+    'warm_up_ms': round((warmed - resolved) * 1000, 1),
+    'warm_up': warm_up,
+    'first_request_ms': round((served - warmed) * 1000, 1),
+    'first_request_status': status[0] if status else None,
+    'pillow_loaded': 'PIL' in sys.modules,
+}))
+"""
+
+
+def parse_importtime(stderr):
+    """Return (module, self_us, cumulative_us) rows from -X importtime output"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+    return rows
+
+
+class Command(BaseCommand):
+    help = "Report cold-start cost: import time per module, warm-up time and time to first request"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=15, help="Number of modules to list")
+        parser.add_argument('--path', default='/health/', help="Path used for the first request")
+        parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+
+    def handle(self, *args, **options):
+        host = next(
+            (h for h in settings.ALLOWED_HOSTS if h != '*' and not h.startswith('.')),
+            'localhost',
+        )
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get(
+            'DJANGO_SETTINGS_MODULE', 'api_core.settings'))
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', PROBE, options['path'], host],
+            capture_output=True, text=True, env=env, cwd=settings.BASE_DIR,
+        )
+        if result.returncode != 0:
+            raise CommandError(f"Startup probe failed:\n{result.stderr[-2000:]}")
+
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+        rows = parse_importtime(result.stderr)
+
+        packages = defaultdict(int)
+        for module, self_us, _ in rows:
+            packages[module.split('.')[0]] += self_us
+        report['import_total_ms'] = round(sum(packages.values()) / 1000, 1)
+        report['packages_ms'] = {
+            name: round(us / 1000, 1)
+            for name, us in sorted(packages.items(), key=lambda item: -item[1])[:options['limit']]
+        }
+        report['modules_ms'] = {
+            module: round(self_us / 1000, 1)
+            for module, self_us, _ in sorted(rows, key=lambda row: -row[1])[:options['limit']]
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(f"Django setup + imports: {report['setup_ms']} ms")
+        self.stdout.write(f"URL resolver (master):  {report['url_resolver_ms']} ms")
+        warm_up = report['warm_up']
+        self.stdout.write(f"Worker warm-up:         {report['warm_up_ms']} ms")
+        self.stdout.write(f"  DB connect:           {warm_up['db_connect_ms']} ms")
+        self.stdout.write(
+            f"  Challenge cache:      {warm_up['challenge_cache_ms']} ms "
+            f"({warm_up['challenges_cached']} challenges cached)"
+        )
+        for error in warm_up['errors']:
+            self.stdout.write(self.style.ERROR(f"  Warm-up failed: {error}"))
+        self.stdout.write(
+            f"First request ({options['path']}): {report['first_request_ms']} ms "
+            f"[{report['first_request_status']}]"
+        )
+        self.stdout.write(f"Pillow imported at startup: {'yes' if report['pillow_loaded'] else 'no'}")
+        self.stdout.write(
+            f"\nTotal import time: {report['import_total_ms']} ms "
+            f"(every module imported, including interpreter start-up and stdlib)"
+        )
+        self.stdout.write("\nImport time by package:")
+        for name, ms in report['packages_ms'].items():
+            self.stdout.write(f"  {ms:>8.1f} ms  {name}")
+        self.stdout.write("\nSlowest modules (self time):")
+        for module, ms in report['modules_ms'].items():
+            self.stdout.write(f"  {ms:>8.1f} ms  {module}")
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0003_alter_challenge_goals'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='challenge',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -28,6 +28,8 @@ class Challenge(models.Model):
     before_message_background_image_url = models.URLField(blank=True, null=True)
     
     created_at = models.DateTimeField(auto_now_add=True)
+    # Lets each worker check a cached copy is current (see cache.py)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'challenges'
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_challenge
+from .models import Challenge
+
+
+@receiver(post_save, sender=Challenge)
+@receiver(post_delete, sender=Challenge)
+def drop_cached_challenge(sender, instance, **kwargs):
+    """Free this process's cached copy; other workers notice the change via updated_at"""
+    invalidate_challenge(instance.id)
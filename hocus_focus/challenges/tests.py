@@ -1,3 +1,104 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.http import Http404
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from .cache import _cache_key, get_challenge_data, warm_challenge_cache
+from .management.commands.startup_report import parse_importtime
+from .models import Challenge
+
+
+class ChallengeCacheTests(TestCase):
+    """Tests for the read-through challenge cache behind GET /challenge/{id}"""
+
+    def setUp(self):
+        cache.clear()
+        self.challenge = Challenge.objects.create(clue='Find the cat')
+        self.url = reverse('get_challenge_by_id', args=[self.challenge.id])
+
+    def test_view_serves_cached_data(self):
+        self.assertEqual(self.client.get(self.url).json()['clue'], 'Find the cat')
+
+        # update() skips signals and leaves updated_at alone, so the cached copy is still served
+        Challenge.objects.filter(id=self.challenge.id).update(clue='Find the dog')
+        self.assertEqual(self.client.get(self.url).json()['clue'], 'Find the cat')
+
+    def test_edit_from_another_worker_is_picked_up(self):
+        self.client.get(self.url)
+
+        # Another worker's save bumps updated_at but cannot clear this process's cache
+        Challenge.objects.filter(id=self.challenge.id).update(
+            clue='Find the dog', updated_at=timezone.now())
+
+        self.assertEqual(self.client.get(self.url).json()['clue'], 'Find the dog')
+
+    def test_save_invalidates_cached_data(self):
+        self.client.get(self.url)
+
+        self.challenge.clue = 'Find the dog'
+        self.challenge.save()
+
+        self.assertEqual(self.client.get(self.url).json()['clue'], 'Find the dog')
+
+    def test_delete_invalidates_cached_data(self):
+        self.client.get(self.url)
+
+        self.challenge.delete()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {'error': 'Challenge not found'})
+
+    def test_missing_challenge_raises_404(self):
+        with self.assertRaises(Http404):
+            get_challenge_data(self.challenge.id + 1)
+
+        response = self.client.get(reverse('get_challenge_by_id', args=[self.challenge.id + 1]))
+        self.assertEqual(response.status_code, 404)
+
+
+class WarmChallengeCacheTests(TestCase):
+    """Tests for warming the cache with today's and upcoming challenges"""
+
+    def setUp(self):
+        cache.clear()
+        today = timezone.localdate()
+        self.past = Challenge.objects.create(clue='Past', date=(today - timedelta(days=1)).isoformat())
+        self.today = Challenge.objects.create(clue='Today', date=today.isoformat())
+        self.next = Challenge.objects.create(clue='Next', date=(today + timedelta(days=1)).isoformat())
+        self.later = Challenge.objects.create(clue='Later', date=(today + timedelta(days=2)).isoformat())
+        self.undated = Challenge.objects.create(clue='Undated')
+
+    def cached_ids(self):
+        challenges = [self.past, self.today, self.next, self.later, self.undated]
+        return {c.id for c in challenges if cache.get(_cache_key(c.id)) is not None}
+
+    def test_caches_today_and_upcoming(self):
+        self.assertEqual(warm_challenge_cache(limit=10), 3)
+        self.assertEqual(self.cached_ids(), {self.today.id, self.next.id, self.later.id})
+
+    def test_limit_keeps_the_soonest(self):
+        self.assertEqual(warm_challenge_cache(limit=2), 2)
+        self.assertEqual(self.cached_ids(), {self.today.id, self.next.id})
+
+
+class ParseImporttimeTests(TestCase):
+    """Tests for parsing `python -X importtime` output in startup_report"""
+
+    def test_parses_rows_and_skips_header(self):
+        stderr = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   _io",
+            "import time:       894 |      16002 |   json.decoder",
+            "import time:       890 |      17676 | json",
+            "some unrelated warning",
+        ])
 
-# Create your tests here.
+        self.assertEqual(parse_importtime(stderr), [
+            ('_io', 120, 120),
+            ('json.decoder', 894, 16002),
+            ('json', 890, 17676),
+        ])
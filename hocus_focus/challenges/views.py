@@ -3,10 +3,9 @@ from rest_framework.decorators import api_view, permission_classes, parser_class
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from django.shortcuts import get_object_or_404
 from django.http import Http404
 
-from .models import Challenge
+from .cache import get_challenge_data
 from .serializers import (
     ChallengeSerializer,
     ChallengeCreateSerializer)
@@ -40,11 +39,11 @@ def get_challenge_by_id(request, challenge_id):
     """
     GET /challenge/{id}
     Get a challenge by ID with all related data
+    Served from the in-process challenge cache when available
     """
     try:
-        challenge = get_object_or_404(Challenge, id=challenge_id)
-        serializer = ChallengeSerializer(challenge)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        data = get_challenge_data(challenge_id)
+        return Response(data, status=status.HTTP_200_OK)
     except Http404:
         return Response(
             {'error': 'Challenge not found'}, 